@@ -5,15 +5,34 @@ A therapeutic game to improve selective attention and impulse control
 """
 
 import pygame
-import random
+import numpy as np
 import math
 import json
 import os
+import gc
 from datetime import datetime
-from typing import List, Dict, Tuple, Optional
+from typing import List, Dict, Tuple, Optional, Deque
+from collections import deque
+from functools import partial
 from enum import Enum
 from dataclasses import dataclass, asdict
 import time
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the NumPy update path is used without it
+    njit = None
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; the standard json module is used without it
+    orjson = None
+
+try:
+    from pygame._sdl2.video import Window, Renderer, Texture
+except ImportError:  # the GPU renderer is optional; the display surface is used without it
+    Window = Renderer = Texture = None
 
 # Initialize Pygame
 pygame.init()
@@ -22,6 +41,21 @@ pygame.init()
 SCREEN_WIDTH = 1200
 SCREEN_HEIGHT = 800
 FPS = 60
+MAX_SIMULATION_STEP = 1 / 30  # seconds; longer frames are simulated in several steps
+MAX_FRAME_TIME = 0.25  # seconds; a stalled frame (e.g. a dragged window) advances play at most this much
+BACKGROUND_PATTERN_SIZE = 50
+BALLOON_STRING_LENGTH = 20
+SHAPE_PADDING = 3  # room around cached shapes for outlines drawn past the radius
+TEXT_CACHE_SIZE = 256  # rendered labels kept before the cache is reset
+SPAWN_RANDOM_COUNT = 8  # uniform draws consumed by each spawn
+USE_GPU_RENDERER = os.environ.get('FOCUS_CATCHER_GPU') == '1' and Renderer is not None
+
+# Save files
+SESSIONS_FILE = 'focus_game_sessions.jsonl'  # one finished session per line, append-only
+LEGACY_SESSIONS_FILE = 'focus_game_sessions.json'  # read-only, from before the session log
+PROGRESS_FILE = 'focus_game_progress.json'
+SUMMARY_FILE = 'focus_game_summary.json'  # running totals over every saved session
+RECENT_SESSIONS = 50  # finished sessions kept in memory
 
 # Colors
 COLORS = {
@@ -39,6 +73,16 @@ COLORS = {
     'light_gray': (189, 195, 199),
 }
 
+def _json_dumps(obj) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
+
+def _json_loads(data: bytes):
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 # Game States
 class GameState(Enum):
     MENU = "menu"
@@ -55,7 +99,7 @@ class ObjectType(Enum):
     CIRCLE = "circle"
     TRIANGLE = "triangle"
 
-@dataclass
+@dataclass(slots=True)
 class LevelConfig:
     level: int
     name: str
@@ -71,7 +115,7 @@ class LevelConfig:
     background_speed: float
     time_limit: Optional[int] = None  # seconds
 
-@dataclass
+@dataclass(slots=True)
 class GameSession:
     id: str
     level: int
@@ -88,7 +132,7 @@ class GameSession:
         if self.reaction_times is None:
             self.reaction_times = []
 
-@dataclass
+@dataclass(slots=True)
 class LevelProgress:
     level: int
     best_accuracy: float = 0.0
@@ -96,170 +140,230 @@ class LevelProgress:
     times_played: int = 0
     last_played: float = 0.0
 
-class GameObject:
-    def __init__(self, obj_type: ObjectType, x: float, y: float, is_target: bool, spawn_time: float, lifespan: int = 3000):
-        self.id = f"obj_{int(time.time() * 1000)}_{random.randint(1000, 9999)}"
-        self.type = obj_type
-        self.x = x
-        self.y = y
-        self.is_target = is_target
-        self.spawn_time = spawn_time
-        self.lifespan = lifespan
-        
-        # Size and appearance
-        base_size = 60
-        size_variation = 20
-        self.size = base_size + (random.random() - 0.5) * size_variation
-        
-        # Colors
-        target_colors = [COLORS['red'], COLORS['green'], COLORS['blue'], COLORS['yellow'], COLORS['orange']]
-        distractor_colors = [COLORS['gray'], COLORS['dark_gray'], COLORS['light_gray']]
-        self.color = random.choice(target_colors if is_target else distractor_colors)
-        
-        # Movement
-        max_velocity = 50
-        self.velocity_x = (random.random() - 0.5) * max_velocity
-        self.velocity_y = (random.random() - 0.5) * max_velocity
-        
-        # Animation
-        self.rotation = 0
-        self.rotation_speed = (random.random() - 0.5) * 4
-        self.scale = 1.0
-        self.scale_direction = 1
-        
-    def update(self, delta_time: float):
-        # Update position
-        self.x += self.velocity_x * delta_time
-        self.y += self.velocity_y * delta_time
-        
-        # Update rotation
-        self.rotation += self.rotation_speed * delta_time
-        
-        # Update scale (breathing effect)
-        self.scale += self.scale_direction * delta_time * 0.5
-        if self.scale > 1.2:
-            self.scale = 1.2
-            self.scale_direction = -1
-        elif self.scale < 0.8:
-            self.scale = 0.8
-            self.scale_direction = 1
-    
-    def draw(self, screen: pygame.Surface):
-        center_x = int(self.x + self.size / 2)
-        center_y = int(self.y + self.size / 2)
-        scaled_size = int(self.size * self.scale)
-        
-        if self.type == ObjectType.STAR:
-            self._draw_star(screen, center_x, center_y, scaled_size // 2)
-        elif self.type == ObjectType.BALLOON:
-            self._draw_balloon(screen, center_x, center_y, scaled_size // 2)
-        elif self.type == ObjectType.HEART:
-            self._draw_heart(screen, center_x, center_y, scaled_size // 2)
-        elif self.type == ObjectType.CIRCLE:
-            self._draw_circle(screen, center_x, center_y, scaled_size // 2)
-        elif self.type == ObjectType.TRIANGLE:
-            self._draw_triangle(screen, center_x, center_y, scaled_size // 2)
-    
-    def _draw_star(self, screen: pygame.Surface, x: int, y: int, radius: int):
-        points = []
-        spikes = 5
-        outer_radius = radius
-        inner_radius = radius * 0.4
-        
-        for i in range(spikes * 2):
-            angle = (i * math.pi) / spikes
-            r = outer_radius if i % 2 == 0 else inner_radius
-            px = x + math.cos(angle) * r
-            py = y + math.sin(angle) * r
-            points.append((px, py))
-        
-        pygame.draw.polygon(screen, self.color, points)
-        if self.is_target:
-            pygame.draw.polygon(screen, COLORS['white'], points, 3)
-    
-    def _draw_balloon(self, screen: pygame.Surface, x: int, y: int, radius: int):
-        # Balloon body
-        pygame.draw.ellipse(screen, self.color, (x - radius, y - radius, radius * 2, radius * 2))
-        if self.is_target:
-            pygame.draw.ellipse(screen, COLORS['white'], (x - radius, y - radius, radius * 2, radius * 2), 3)
-        
-        # Balloon string
-        pygame.draw.line(screen, COLORS['black'], (x, y + radius), (x, y + radius + 20), 2)
-    
-    def _draw_heart(self, screen: pygame.Surface, x: int, y: int, size: int):
-        # Simplified heart shape using circles and polygon
-        heart_points = [
-            (x, y + size // 4),
-            (x - size // 2, y - size // 4),
-            (x - size // 2, y),
-            (x - size // 4, y - size // 4),
-            (x, y - size // 8),
-            (x + size // 4, y - size // 4),
-            (x + size // 2, y),
-            (x + size // 2, y - size // 4),
-            (x, y + size // 2)
-        ]
-        pygame.draw.polygon(screen, self.color, heart_points)
-        if self.is_target:
-            pygame.draw.polygon(screen, COLORS['white'], heart_points, 3)
-    
-    def _draw_circle(self, screen: pygame.Surface, x: int, y: int, radius: int):
-        pygame.draw.circle(screen, self.color, (x, y), radius)
-        if self.is_target:
-            pygame.draw.circle(screen, COLORS['white'], (x, y), radius, 3)
-    
-    def _draw_triangle(self, screen: pygame.Surface, x: int, y: int, size: int):
-        height = int(size * math.sqrt(3) / 2)
-        points = [
-            (x, y - height // 2),
-            (x - size // 2, y + height // 2),
-            (x + size // 2, y + height // 2)
-        ]
-        pygame.draw.polygon(screen, self.color, points)
-        if self.is_target:
-            pygame.draw.polygon(screen, COLORS['white'], points, 3)
+# Object palettes, indexed by the per-object color slot
+TARGET_COLORS = (COLORS['red'], COLORS['green'], COLORS['blue'], COLORS['yellow'], COLORS['orange'])
+DISTRACTOR_COLORS = (COLORS['gray'], COLORS['dark_gray'], COLORS['light_gray'])
+OBJECT_COLORS = TARGET_COLORS + DISTRACTOR_COLORS
+
+# Object types, indexed by the per-object type slot
+OBJECT_TYPES = tuple(ObjectType)
+OBJECT_TYPE_SLOTS = {obj_type: i for i, obj_type in enumerate(OBJECT_TYPES)}
+
+# Outline offsets for the polygon shapes, built with the original per-frame math once per radius
+def _star_offsets(radius: int) -> List[Tuple[int, int]]:
+    # pygame truncates the float points it is given, which for on-surface points is a floor
+    offsets = []
+    for i in range(10):
+        angle = (i * math.pi) / 5
+        r = radius if i % 2 == 0 else radius * 0.4
+        offsets.append((math.floor(math.cos(angle) * r), math.floor(math.sin(angle) * r)))
+    return offsets
+
+def _triangle_offsets(size: int) -> List[Tuple[int, int]]:
+    height = int(size * math.sqrt(3) / 2)
+    return [(0, -(height // 2)), (-(size // 2), height // 2), (size // 2, height // 2)]
+
+_OUTLINE_BUILDERS = {
+    ObjectType.STAR: _star_offsets,
+    ObjectType.TRIANGLE: _triangle_offsets,
+}
+_OUTLINE_CACHE: Dict[Tuple[ObjectType, int], List[Tuple[int, int]]] = {}
+
+def _outline_points(obj_type: ObjectType, x: int, y: int, radius: int) -> List[Tuple[int, int]]:
+    offsets = _OUTLINE_CACHE.get((obj_type, radius))
+    if offsets is None:
+        offsets = _OUTLINE_CACHE[(obj_type, radius)] = _OUTLINE_BUILDERS[obj_type](radius)
+    return [(x + dx, y + dy) for dx, dy in offsets]
+
+def _draw_star(screen: pygame.Surface, color: Tuple[int, int, int], is_target: bool, x: int, y: int, radius: int):
+    points = _outline_points(ObjectType.STAR, x, y, radius)
+    pygame.draw.polygon(screen, color, points)
+    if is_target:
+        pygame.draw.polygon(screen, COLORS['white'], points, 3)
+
+def _draw_balloon(screen: pygame.Surface, color: Tuple[int, int, int], is_target: bool, x: int, y: int, radius: int):
+    # Balloon body
+    pygame.draw.ellipse(screen, color, (x - radius, y - radius, radius * 2, radius * 2))
+    if is_target:
+        pygame.draw.ellipse(screen, COLORS['white'], (x - radius, y - radius, radius * 2, radius * 2), 3)
+    
+    # Balloon string
+    pygame.draw.line(screen, COLORS['black'], (x, y + radius), (x, y + radius + BALLOON_STRING_LENGTH), 2)
+
+def _fill_heart(screen: pygame.Surface, color: Tuple[int, int, int], x: int, y: int, size: int):
+    # Two round lobes over a downward triangle, spanning size in every direction from the center
+    half = size // 2
+    pygame.draw.circle(screen, color, (x - half, y - half), half)
+    pygame.draw.circle(screen, color, (x + half, y - half), half)
+    pygame.draw.polygon(screen, color, [(x - size, y - half), (x + size, y - half), (x, y + size)])
+
+def _draw_heart(screen: pygame.Surface, color: Tuple[int, int, int], is_target: bool, x: int, y: int, size: int):
+    # Targets get their white rim from a full-size white heart under a smaller colored one
+    if is_target:
+        _fill_heart(screen, COLORS['white'], x, y, size)
+        _fill_heart(screen, color, x, y, size - 3)
+    else:
+        _fill_heart(screen, color, x, y, size)
+
+def _draw_circle(screen: pygame.Surface, color: Tuple[int, int, int], is_target: bool, x: int, y: int, radius: int):
+    pygame.draw.circle(screen, color, (x, y), radius)
+    if is_target:
+        pygame.draw.circle(screen, COLORS['white'], (x, y), radius, 3)
+
+def _draw_triangle(screen: pygame.Surface, color: Tuple[int, int, int], is_target: bool, x: int, y: int, size: int):
+    points = _outline_points(ObjectType.TRIANGLE, x, y, size)
+    pygame.draw.polygon(screen, color, points)
+    if is_target:
+        pygame.draw.polygon(screen, COLORS['white'], points, 3)
+
+# Shape renderers, indexed by the per-object type slot
+SHAPE_DRAWERS = tuple({
+    ObjectType.STAR: _draw_star,
+    ObjectType.BALLOON: _draw_balloon,
+    ObjectType.HEART: _draw_heart,
+    ObjectType.CIRCLE: _draw_circle,
+    ObjectType.TRIANGLE: _draw_triangle,
+}[obj_type] for obj_type in OBJECT_TYPES)
+
+def _to_display_format(surface: pygame.Surface, alpha: bool = False) -> pygame.Surface:
+    # Match the display's pixel format for fast blits; the GPU renderer has no display surface
+    if pygame.display.get_surface() is None:
+        return surface
+    return surface.convert_alpha() if alpha else surface.convert()
+
+# Pre-rendered shapes keyed by (type slot, color slot, is_target, radius)
+_SHAPE_CACHE: Dict[Tuple[int, int, bool, int], pygame.Surface] = {}
+
+def _shape_surface(type_index: int, color_index: int, is_target: bool, radius: int) -> pygame.Surface:
+    key = (type_index, color_index, is_target, radius)
+    surface = _SHAPE_CACHE.get(key)
+    if surface is None:
+        center = radius + SHAPE_PADDING
+        surface = pygame.Surface((center * 2 + 1, center * 2 + 1 + BALLOON_STRING_LENGTH), pygame.SRCALPHA)
+        SHAPE_DRAWERS[type_index](surface, OBJECT_COLORS[color_index], is_target, center, center, radius)
+        surface = _to_display_format(surface, alpha=True)
+        _SHAPE_CACHE[key] = surface
+    return surface
+
+def _step_objects(x, y, vx, vy, scale, scale_dir, spawn, size, n, now, lifespan, dt):
+    # Advance the first n objects in place and return the mask of objects to keep
+    x, y, size = x[:n], y[:n], size[:n]
+    scale, scale_dir = scale[:n], scale_dir[:n]
     
-    def is_point_inside(self, px: int, py: int) -> bool:
-        center_x = self.x + self.size / 2
-        center_y = self.y + self.size / 2
-        distance = math.sqrt((px - center_x) ** 2 + (py - center_y) ** 2)
-        return distance <= (self.size / 2) * self.scale
+    # Update position
+    x += vx[:n] * dt
+    y += vy[:n] * dt
     
-    def is_expired(self, current_time: float) -> bool:
-        return (current_time - self.spawn_time) > self.lifespan
+    # Update scale (breathing effect)
+    scale += scale_dir * (dt * 0.5)
+    grown = scale > 1.2
+    scale[grown] = 1.2
+    scale_dir[grown] = -1
+    shrunk = scale < 0.8
+    scale[shrunk] = 0.8
+    scale_dir[shrunk] = 1
+    
+    # Keep objects that are neither expired nor off-screen
+    keep = (now - spawn[:n]) <= lifespan
+    keep &= (x >= -size) & (x <= SCREEN_WIDTH + size)
+    keep &= (y >= -size) & (y <= SCREEN_HEIGHT + size)
+    return keep
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def _step_objects(x, y, vx, vy, scale, scale_dir, spawn, size, n, now, lifespan, dt):
+        keep = np.empty(n, np.bool_)
+        for i in range(n):
+            x[i] += vx[i] * dt
+            y[i] += vy[i] * dt
+            
+            scale[i] += scale_dir[i] * (dt * 0.5)
+            if scale[i] > 1.2:
+                scale[i] = 1.2
+                scale_dir[i] = -1
+            elif scale[i] < 0.8:
+                scale[i] = 0.8
+                scale_dir[i] = 1
+            
+            keep[i] = ((now - spawn[i]) <= lifespan and
+                       -size[i] <= x[i] <= SCREEN_WIDTH + size[i] and
+                       -size[i] <= y[i] <= SCREEN_HEIGHT + size[i])
+        return keep
 
 class FocusCatcherGame:
     def __init__(self):
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-        pygame.display.set_caption("Focus Catcher - Visual Attention Game")
+        if USE_GPU_RENDERER:
+            # Menus and UI are still drawn in software onto an off-screen canvas
+            self.window = Window("Focus Catcher - Visual Attention Game", (SCREEN_WIDTH, SCREEN_HEIGHT))
+            self.renderer = Renderer(self.window)  # prefers an accelerated driver
+            self.screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        else:
+            self.renderer = None
+            self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.DOUBLEBUF | pygame.HWSURFACE)
+            pygame.display.set_caption("Focus Catcher - Visual Attention Game")
         self.clock = pygame.time.Clock()
         self.running = True
         
         # Game state
         self.game_state = GameState.MENU
         self.current_level = 1
+        self.current_level_config: Optional[LevelConfig] = None  # set while a level is being played
         self.current_session: Optional[GameSession] = None
-        self.sessions: List[GameSession] = []
-        self.level_progress: List[LevelProgress] = []
+        self.sessions: Deque[GameSession] = deque(maxlen=RECENT_SESSIONS)
+        self._sessions_total = 0
+        self._sessions_accuracy_sum = 0.0
+        self._session_log_unterminated = False  # the log ends in a partial line from an interrupted append
+        self.level_progress: Dict[int, LevelProgress] = {}  # keyed by level, in first-played order
         self.game_score = 0
         self.lives = 3
         
         # Game objects
-        self.game_objects: List[GameObject] = []
-        self.last_spawn_time = 0
+        self._rng = np.random.default_rng()
+        self._spawn_draws = np.empty(SPAWN_RANDOM_COUNT)  # reused by every spawn's random draw
+        self._spawn_interval = 0.0  # milliseconds between spawns for the current level
+        self._spawn_accum = 0.0  # milliseconds elapsed towards the next spawn
+        self._background_speed = 0.0
+        self._object_lifespan = 0.0
         self.background_offset = 0
-        self.game_time = 0
-        self.start_time = 0
+        self._prev_object_rects: Optional[List[pygame.Rect]] = None  # last presented PLAYING frame
+        self._prev_pattern_offset = 0
+        self._presented_state: Optional[GameState] = None  # state of the frame last shown on screen
+        self.game_time = 0  # seconds of unpaused play, the clock for spawn and click times
         
         # Fonts
         self.font_large = pygame.font.Font(None, 48)
         self.font_medium = pygame.font.Font(None, 36)
         self.font_small = pygame.font.Font(None, 24)
         
+        # Pre-rendered background layers
+        self._build_background()
+        
         # Level configurations
         self.level_configs = self._create_level_configs()
-        
-        # Load saved data
+        self._level_configs_by_level = {config.level: config for config in self.level_configs}
+        
+        # Game objects, stored as parallel arrays sized for the busiest level
+        self._allocate_objects(max(config.max_objects for config in self.level_configs))
+        if njit is not None:
+            # Compile (or load from cache) the update kernel now rather than on the first busy frame
+            self._step(0, 0.0, 0.0, 0.0)
+        
+        # Static UI layout and rendered text
+        self._text_cache: Dict[Tuple[pygame.font.Font, str, Tuple[int, int, int]], pygame.Surface] = {}
+        self._screen_cache: Dict[GameState, pygame.Surface] = {}
+        self._paused_snapshot: Optional[pygame.Surface] = None
+        self._build_ui()
+        self._build_dispatch()
+        
+        # Only the events run() handles reach the queue; SDL drops the rest (mouse motion
+        # above all) before they become Python objects
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(list(self._event_handlers))
+        if self.renderer:
+            self._build_textures()
+        
+        # Load saved data; saves run on a background thread
+        self._io = ThreadPoolExecutor(max_workers=1)
         self._load_saved_data()
     
     def _create_level_configs(self) -> List[LevelConfig]:
@@ -286,48 +390,160 @@ class FocusCatcherGame:
                        [ObjectType.CIRCLE, ObjectType.TRIANGLE, ObjectType.HEART, ObjectType.BALLOON], 3.0, 1400, 0.15, 15, 35, 8, 50, 60),
         ]
     
+    def _allocate_objects(self, capacity: int):
+        # Fixed pool allocated once; slots [0, obj_count) hold the live objects in
+        # draw order (last is topmost), so spawning just claims slot obj_count
+        self.obj_x = np.zeros(capacity, np.float32)
+        self.obj_y = np.zeros(capacity, np.float32)
+        self.obj_vx = np.zeros(capacity, np.float32)
+        self.obj_vy = np.zeros(capacity, np.float32)
+        self.obj_size = np.zeros(capacity, np.float32)
+        self.obj_scale = np.zeros(capacity, np.float32)
+        self.obj_scale_dir = np.zeros(capacity, np.float32)
+        self.obj_spawn = np.zeros(capacity, np.float32)  # game_time in milliseconds, sub-ms precise for 2h
+        self.obj_is_target = np.zeros(capacity, np.bool_)
+        self.obj_type = np.zeros(capacity, np.int8)  # index into OBJECT_TYPES
+        self.obj_color = np.zeros(capacity, np.int8)  # index into OBJECT_COLORS
+        self.obj_count = 0
+        self._obj_arrays = (
+            self.obj_x, self.obj_y, self.obj_vx, self.obj_vy, self.obj_size,
+            self.obj_scale, self.obj_scale_dir,
+            self.obj_spawn, self.obj_is_target, self.obj_type, self.obj_color,
+        )
+    
+    def _step(self, n: int, current_time: float, lifespan: float, delta_time: float) -> np.ndarray:
+        return _step_objects(self.obj_x, self.obj_y, self.obj_vx, self.obj_vy,
+                             self.obj_scale, self.obj_scale_dir, self.obj_spawn, self.obj_size,
+                             n, current_time, lifespan, delta_time)
+    
+    def _remove_objects(self, keep: np.ndarray):
+        # Compact the survivors to the front of every array, preserving draw order
+        n = self.obj_count
+        survivors = int(np.count_nonzero(keep))
+        if survivors == n:
+            return
+        for arr in self._obj_arrays:
+            arr[:survivors] = np.compress(keep, arr[:n])
+        self.obj_count = survivors
+    
+    def _remove_object(self, index: int):
+        # Shift the objects above the removed slot down by one, preserving draw order
+        n = self.obj_count
+        for arr in self._obj_arrays:
+            arr[index:n - 1] = arr[index + 1:n]
+        self.obj_count = n - 1
+    
     def _load_saved_data(self):
+        # Each file loads on its own, so a damaged session log can never cost level progress
+        summary = None
         try:
-            if os.path.exists('focus_game_sessions.json'):
-                with open('focus_game_sessions.json', 'r') as f:
-                    data = json.load(f)
-                    self.sessions = [GameSession(**session) for session in data]
+            if os.path.exists(SUMMARY_FILE):
+                with open(SUMMARY_FILE, 'rb') as f:
+                    summary = _json_loads(f.read())
+        except Exception as e:
+            print(f"Error loading session summary, rebuilding it from the log: {e}")
+        
+        try:
+            # Sessions saved before the append-only log was introduced
+            records = []
+            if os.path.exists(LEGACY_SESSIONS_FILE):
+                with open(LEGACY_SESSIONS_FILE, 'rb') as f:
+                    records.extend(_json_loads(f.read()))
+            
+            # With running totals on disk only the recent tail of the log needs parsing
+            if os.path.exists(SESSIONS_FILE):
+                with open(SESSIONS_FILE, 'rb') as f:
+                    lines = (line for line in f if line.strip())
+                    if summary is not None:
+                        lines = deque(lines, maxlen=RECENT_SESSIONS)
+                    records.extend(self._parse_session_lines(lines))
+                    
+                    # An append cut short leaves the last line unterminated; the next
+                    # append must start on a fresh line or it would be lost with it
+                    f.seek(0, os.SEEK_END)
+                    if f.tell():
+                        f.seek(-1, os.SEEK_END)
+                        self._session_log_unterminated = f.read(1) != b"\n"
             
-            if os.path.exists('focus_game_progress.json'):
-                with open('focus_game_progress.json', 'r') as f:
-                    data = json.load(f)
-                    self.level_progress = [LevelProgress(**progress) for progress in data]
+            self.sessions.extend(GameSession(**record) for record in records[-RECENT_SESSIONS:])
+            if summary is not None:
+                self._sessions_total = summary['total_sessions']
+                self._sessions_accuracy_sum = summary['accuracy_sum']
+            else:
+                self._sessions_total = len(records)
+                self._sessions_accuracy_sum = sum(record['accuracy'] for record in records)
         except Exception as e:
-            print(f"Error loading saved data: {e}")
+            print(f"Error loading saved sessions: {e}")
+        
+        try:
+            if os.path.exists(PROGRESS_FILE):
+                with open(PROGRESS_FILE, 'rb') as f:
+                    data = _json_loads(f.read())
+                    self.level_progress = {progress['level']: LevelProgress(**progress) for progress in data}
+        except Exception as e:
+            print(f"Error loading level progress: {e}")
+    
+    @staticmethod
+    def _parse_session_lines(lines) -> List[dict]:
+        records = []
+        for line in lines:
+            try:
+                records.append(_json_loads(line))
+            except ValueError:
+                # Typically a half-written last line from an interrupted append
+                print(f"Skipping malformed session record: {line[:60]!r}")
+        return records
     
-    def _save_data(self):
+    def _save_data(self, session: GameSession):
+        # Serialize on the game thread so the I/O thread never sees state mid-update
+        session_line = _json_dumps(asdict(session)) + b"\n"
+        if self._session_log_unterminated:
+            session_line = b"\n" + session_line
+            self._session_log_unterminated = False
+        progress = _json_dumps([asdict(progress) for progress in self.level_progress.values()])
+        summary = _json_dumps({'total_sessions': self._sessions_total, 'accuracy_sum': self._sessions_accuracy_sum})
+        self._io.submit(self._write_saved_data, session_line, progress, summary)
+    
+    @staticmethod
+    def _write_saved_data(session_line: bytes, progress: bytes, summary: bytes):
         try:
-            with open('focus_game_sessions.json', 'w') as f:
-                json.dump([asdict(session) for session in self.sessions], f)
+            with open(SESSIONS_FILE, 'ab') as f:
+                f.write(session_line)
+            
+            with open(PROGRESS_FILE, 'wb') as f:
+                f.write(progress)
             
-            with open('focus_game_progress.json', 'w') as f:
-                json.dump([asdict(progress) for progress in self.level_progress], f)
+            with open(SUMMARY_FILE, 'wb') as f:
+                f.write(summary)
         except Exception as e:
             print(f"Error saving data: {e}")
     
     def get_level_config(self, level: int) -> Optional[LevelConfig]:
-        return next((config for config in self.level_configs if config.level == level), None)
+        return self._level_configs_by_level.get(level)
     
     def get_level_stats(self, level: int) -> Optional[LevelProgress]:
-        return next((progress for progress in self.level_progress if progress.level == level), None)
+        return self.level_progress.get(level)
+    
+    def is_level_unlocked(self, level: int) -> bool:
+        stats = self.get_level_stats(level)
+        return level == 1 or (stats is not None and stats.best_accuracy >= 70)
     
     def start_game(self, level: int):
         self.current_level = level
+        self.current_level_config = self.get_level_config(level)
         session_id = f"session_{int(time.time() * 1000)}"
         self.current_session = GameSession(session_id, level, time.time())
         self.game_state = GameState.PLAYING
         self.game_score = 0
         self.lives = 3
-        self.game_objects = []
-        self.last_spawn_time = 0
+        self.obj_count = 0
+        # Per-frame constants of the level, read once here instead of through the config each frame
+        self._spawn_interval = 1000.0 / self.current_level_config.spawn_rate
+        self._background_speed = float(self.current_level_config.background_speed)
+        self._object_lifespan = float(self.current_level_config.object_lifespan)
+        self._spawn_accum = self._spawn_interval  # first object appears immediately
         self.background_offset = 0
         self.game_time = 0
-        self.start_time = time.time()
     
     def end_game(self):
         if not self.current_session:
@@ -355,14 +571,16 @@ class FocusCatcherGame:
             existing_progress.last_played = end_time
         else:
             new_progress = LevelProgress(self.current_level, accuracy, avg_reaction_time, 1, end_time)
-            self.level_progress.append(new_progress)
+            self.level_progress[self.current_level] = new_progress
         
         # Save completed session
         self.sessions.append(self.current_session)
+        self._sessions_total += 1
+        self._sessions_accuracy_sum += accuracy
+        self._save_data(self.current_session)
         self.current_session = None
-        
-        # Save data
-        self._save_data()
+        self.current_level_config = None
+        self._screen_cache.clear()  # level select and progress show the new results
         
         # Return to menu
         self.game_state = GameState.MENU
@@ -382,274 +600,442 @@ class FocusCatcherGame:
         self.current_session.reaction_times.append(reaction_time)
         
         # Check win/lose conditions
-        level_config = self.get_level_config(self.current_level)
+        level_config = self.current_level_config
         if level_config:
             if self.current_session.correct_clicks >= level_config.required_correct_clicks:
                 self.end_game()
             elif self.lives <= 0:
                 self.end_game()
     
-    def spawn_object(self):
-        level_config = self.get_level_config(self.current_level)
-        if not level_config or len(self.game_objects) >= level_config.max_objects:
+    def spawn_object(self, delta_time_ms: float, current_time: float):
+        level_config = self.current_level_config
+        if not level_config:
             return
         
-        current_time = time.time() * 1000
-        spawn_interval = 1000 / level_config.spawn_rate
+        # While the level is full the timer holds at one interval, so a freed slot fills at once
+        self._spawn_accum += delta_time_ms
+        if self.obj_count >= level_config.max_objects:
+            self._spawn_accum = min(self._spawn_accum, self._spawn_interval)
+            return
         
-        if current_time - self.last_spawn_time < spawn_interval:
+        if self._spawn_accum < self._spawn_interval:
             return
         
-        self.last_spawn_time = current_time
+        self._spawn_accum -= self._spawn_interval
+        
+        # All of this spawn's randomness in one draw, into a preallocated buffer
+        (u_target, u_type, u_x, u_y, u_size, u_color,
+         u_vx, u_vy) = self._rng.random(out=self._spawn_draws).tolist()
         
         # Determine if target or distractor
-        is_target = random.random() < level_config.target_ratio
-        obj_type = level_config.target_type if is_target else random.choice(level_config.distractor_types)
+        is_target = u_target < level_config.target_ratio
+        if is_target:
+            obj_type = level_config.target_type
+        else:
+            obj_type = level_config.distractor_types[int(u_type * len(level_config.distractor_types))]
         
         # Random position
         margin = 50
-        x = margin + random.random() * (SCREEN_WIDTH - 2 * margin - 60)
-        y = margin + random.random() * (SCREEN_HEIGHT - 2 * margin - 60)
+        x = margin + u_x * (SCREEN_WIDTH - 2 * margin - 60)
+        y = margin + u_y * (SCREEN_HEIGHT - 2 * margin - 60)
+        
+        i = self.obj_count
+        self.obj_count += 1
+        self.obj_x[i] = x
+        self.obj_y[i] = y
+        self.obj_is_target[i] = is_target
+        self.obj_type[i] = OBJECT_TYPE_SLOTS[obj_type]
+        self.obj_spawn[i] = current_time
+        
+        # Size and appearance
+        base_size = 60
+        size_variation = 20
+        self.obj_size[i] = base_size + (u_size - 0.5) * size_variation
+        if is_target:
+            self.obj_color[i] = int(u_color * len(TARGET_COLORS))
+        else:
+            self.obj_color[i] = len(TARGET_COLORS) + int(u_color * len(DISTRACTOR_COLORS))
+        
+        # Movement
+        max_velocity = 50
+        self.obj_vx[i] = (u_vx - 0.5) * max_velocity
+        self.obj_vy[i] = (u_vy - 0.5) * max_velocity
         
-        obj = GameObject(obj_type, x, y, is_target, current_time, level_config.object_lifespan)
-        self.game_objects.append(obj)
+        # Animation (shapes are drawn upright; only the breathing scale is animated)
+        self.obj_scale[i] = 1.0
+        self.obj_scale_dir[i] = 1
     
-    def update_objects(self, delta_time: float):
-        current_time = time.time() * 1000
+    def update_objects(self, delta_time: float, current_time: float):
+        n = self.obj_count
+        if n == 0:
+            return
         
-        # Update existing objects
-        for obj in self.game_objects[:]:
-            obj.update(delta_time)
-            
-            # Remove expired objects
-            if obj.is_expired(current_time):
-                self.game_objects.remove(obj)
-            
-            # Remove off-screen objects
-            elif (obj.x < -obj.size or obj.x > SCREEN_WIDTH + obj.size or 
-                  obj.y < -obj.size or obj.y > SCREEN_HEIGHT + obj.size):
-                self.game_objects.remove(obj)
+        keep = self._step(n, current_time, self._object_lifespan, delta_time)
+        
+        # Remove expired and off-screen objects
+        self._remove_objects(keep)
     
     def handle_click(self, pos: Tuple[int, int]):
         if self.game_state != GameState.PLAYING:
             return
         
-        click_time = time.time() * 1000
-        hit_object = None
-        
-        # Find clicked object (topmost)
-        for obj in reversed(self.game_objects):
-            if obj.is_point_inside(pos[0], pos[1]):
-                hit_object = obj
-                break
-        
-        if hit_object:
-            reaction_time = click_time - hit_object.spawn_time
-            self.game_objects.remove(hit_object)
-            self.record_click(hit_object.is_target, reaction_time)
+        click_time = self.game_time * 1000
+        
+        # Find clicked object (topmost), comparing squared distances to squared radii
+        n = self.obj_count
+        half_size = self.obj_size[:n] * 0.5
+        dx = self.obj_x[:n] + half_size - pos[0]
+        dy = self.obj_y[:n] + half_size - pos[1]
+        radius = half_size * self.obj_scale[:n]
+        hits = np.flatnonzero(dx * dx + dy * dy <= radius * radius)
+        hit_index = hits[-1] if hits.size else -1
+        
+        if hit_index >= 0:
+            reaction_time = click_time - float(self.obj_spawn[hit_index])
+            is_target = bool(self.obj_is_target[hit_index])
+            self._remove_object(hit_index)
+            self.record_click(is_target, reaction_time)
         else:
             # Clicked empty space - incorrect
-            reaction_time = click_time - self.start_time * 1000
+            reaction_time = click_time
             self.record_click(False, reaction_time)
     
-    def draw_background(self):
-        # Gradient background
+    def _object_sprites(self) -> List[Tuple[Tuple[int, int, bool, int], Tuple[int, int]]]:
+        # (shape cache key, top-left position) for every live object, in draw order
+        n = self.obj_count
+        sprites = []
+        for x, y, size, scale, type_index, color_index, is_target in zip(
+                self.obj_x[:n].tolist(), self.obj_y[:n].tolist(), self.obj_size[:n].tolist(),
+                self.obj_scale[:n].tolist(), self.obj_type[:n].tolist(), self.obj_color[:n].tolist(),
+                self.obj_is_target[:n].tolist()):
+            center_x = int(x + size / 2)
+            center_y = int(y + size / 2)
+            radius = int(size * scale) // 2
+            offset = radius + SHAPE_PADDING
+            sprites.append(((type_index, color_index, is_target, radius), (center_x - offset, center_y - offset)))
+        return sprites
+    
+    def draw_objects(self) -> List[pygame.Rect]:
+        # One blits() call for the whole batch instead of a Python-level blit per object
+        return self.screen.blits([(_shape_surface(*key), position) for key, position in self._object_sprites()])
+    
+    def _build_textures(self):
+        self._bg_texture = Texture.from_surface(self.renderer, self._bg_surface)
+        self._pattern_texture = Texture.from_surface(self.renderer, self._pattern_layer)
+        self._canvas_texture = Texture(self.renderer, (SCREEN_WIDTH, SCREEN_HEIGHT), streaming=True)
+        self._ui_texture = Texture(self.renderer, self._ui_bar.size, streaming=True)
+        self._ui_texture_key = None  # HUD values the UI texture was last uploaded for
+        self._shape_textures: Dict[Tuple[int, int, bool, int], Texture] = {}
+    
+    def _render_playing(self):
+        # PLAYING frame on the GPU: background, pattern and shapes are textures; the
+        # software-drawn UI bar is uploaded only when the HUD changes
+        self.renderer.clear()
+        self._bg_texture.draw()
+        offset = self._pattern_offset()
+        self._pattern_texture.draw(dstrect=(offset, offset, self._pattern_texture.width, self._pattern_texture.height))
+        
+        for key, (x, y) in self._object_sprites():
+            texture = self._shape_textures.get(key)
+            if texture is None:
+                texture = self._shape_textures[key] = Texture.from_surface(self.renderer, _shape_surface(*key))
+            texture.draw(dstrect=(x, y, texture.width, texture.height))
+        
+        if self._refresh_hud():
+            if self._ui_texture_key != self._hud_key:
+                self._ui_texture.update(self._hud_surface)
+                self._ui_texture_key = self._hud_key
+            self._ui_texture.draw(dstrect=self._ui_bar)
+        self.renderer.present()
+    
+    def _present_canvas(self):
+        self._canvas_texture.update(self.screen)
+        self._canvas_texture.draw()
+        self.renderer.present()
+    
+    def _build_background(self):
+        # Gradient background, rendered once and blitted every frame
+        self._bg_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
         for y in range(SCREEN_HEIGHT):
             ratio = y / SCREEN_HEIGHT
             r = int(COLORS['background'][0] * (1 - ratio) + COLORS['purple'][0] * ratio)
             g = int(COLORS['background'][1] * (1 - ratio) + COLORS['purple'][1] * ratio)
             b = int(COLORS['background'][2] * (1 - ratio) + COLORS['purple'][2] * ratio)
-            pygame.draw.line(self.screen, (r, g, b), (0, y), (SCREEN_WIDTH, y))
+            pygame.draw.line(self._bg_surface, (r, g, b), (0, y), (SCREEN_WIDTH, y))
+        self._bg_surface = _to_display_format(self._bg_surface)
+        
+        # Dot pattern tile, tiled once into a layer that overhangs the screen by a tile on each side
+        pattern_size = BACKGROUND_PATTERN_SIZE
+        tile_size = pattern_size * 2
+        half = pattern_size // 2
+        self._pattern_tile = pygame.Surface((tile_size, tile_size), pygame.SRCALPHA)
+        for x in range(half, tile_size, pattern_size):
+            for y in range(half, tile_size, pattern_size):
+                pygame.draw.circle(self._pattern_tile, COLORS['white'], (x, y), 3)
+        
+        self._pattern_layer = pygame.Surface((SCREEN_WIDTH + 2 * tile_size, SCREEN_HEIGHT + 2 * tile_size), pygame.SRCALPHA)
+        for x in range(0, SCREEN_WIDTH + 2 * tile_size, tile_size):
+            for y in range(0, SCREEN_HEIGHT + 2 * tile_size, tile_size):
+                self._pattern_layer.blit(self._pattern_tile, (x, y))
+        self._pattern_layer = _to_display_format(self._pattern_layer, alpha=True)
+        # The layer is almost entirely transparent; RLE lets the scrolling blit skip the empty runs
+        self._pattern_layer.set_alpha(255, pygame.RLEACCEL)
+    
+    def _pattern_offset(self) -> int:
+        tile_size = BACKGROUND_PATTERN_SIZE * 2
+        return int(self.background_offset % tile_size) - tile_size - BACKGROUND_PATTERN_SIZE // 2
+    
+    def draw_background(self):
+        # Gradient background
+        self.screen.blit(self._bg_surface, (0, 0))
         
         # Moving pattern
-        pattern_size = 50
-        for x in range(-pattern_size, SCREEN_WIDTH + pattern_size, pattern_size):
-            for y in range(-pattern_size, SCREEN_HEIGHT + pattern_size, pattern_size):
-                offset_x = x + (self.background_offset % (pattern_size * 2))
-                offset_y = y + (self.background_offset % (pattern_size * 2))
-                pygame.draw.circle(self.screen, (*COLORS['white'][:3], 25), (int(offset_x), int(offset_y)), 3)
+        offset = self._pattern_offset()
+        self.screen.blit(self._pattern_layer, (offset, offset))
+    
+    def _build_ui(self):
+        # Menu buttons
+        button_width, button_height = 200, 50
+        self._start_button = pygame.Rect(SCREEN_WIDTH // 2 - button_width // 2, 400, button_width, button_height)
+        self._progress_button = pygame.Rect(SCREEN_WIDTH // 2 - button_width // 2, 480, button_width, button_height)
+        
+        # Level select buttons
+        cols = 5
+        button_width, button_height = 200, 120
+        start_x = (SCREEN_WIDTH - cols * button_width - (cols - 1) * 20) // 2
+        start_y = 150
+        self._level_buttons: List[Tuple[pygame.Rect, LevelConfig]] = []
+        for i, config in enumerate(self.level_configs):
+            row = i // cols
+            col = i % cols
+            x = start_x + col * (button_width + 20)
+            y = start_y + row * (button_height + 30)
+            self._level_buttons.append((pygame.Rect(x, y, button_width, button_height), config))
+        # (left, top, right, bottom) of every level button, for a single vectorized hit test
+        self._level_button_bounds = np.array([(rect.left, rect.top, rect.right, rect.bottom) for rect, _ in self._level_buttons], dtype=np.int32)
+        self._level_select_back_button = pygame.Rect(50, 50, 100, 40)
+        
+        # In-game UI bar and pause buttons
+        self._ui_bar = pygame.Rect(0, 0, SCREEN_WIDTH, 80)
+        self._pause_button = pygame.Rect(SCREEN_WIDTH - 80, 10, 60, 30)
+        self._hud_surface = _to_display_format(pygame.Surface(self._ui_bar.size))
+        self._hud_key = None
+        dialog_width, dialog_height = 400, 200
+        self._pause_dialog = pygame.Rect((SCREEN_WIDTH - dialog_width) // 2, (SCREEN_HEIGHT - dialog_height) // 2, dialog_width, dialog_height)
+        self._resume_button = pygame.Rect(self._pause_dialog.centerx - 80, self._pause_dialog.centery + 20, 160, 40)
+        
+        # Semi-transparent pause overlay
+        self._pause_overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self._pause_overlay.set_alpha(128)
+        self._pause_overlay.fill(COLORS['black'])
+        
+        # Progress screen
+        self._progress_back_button = pygame.Rect(50, SCREEN_HEIGHT - 80, 100, 40)
+    
+    def _render_text(self, font: pygame.font.Font, text: str, color: Tuple[int, int, int]) -> pygame.Surface:
+        # Font rendering is slow, so each distinct label is rendered once and reused
+        key = (font, text, color)
+        surface = self._text_cache.get(key)
+        if surface is None:
+            if len(self._text_cache) >= TEXT_CACHE_SIZE:
+                self._text_cache.clear()
+            surface = self._text_cache[key] = _to_display_format(font.render(text, True, color), alpha=True)
+        return surface
+    
+    def _draw_cached_screen(self, draw):
+        # Menu, level select and progress only change when a game ends, so each is
+        # drawn once into a full-screen copy and blitted back on later visits
+        surface = self._screen_cache.get(self.game_state)
+        if surface is None:
+            draw()
+            self._screen_cache[self.game_state] = self.screen.copy()
+        else:
+            self.screen.blit(surface, (0, 0))
+    
+    def _present_playing(self, object_rects: List[pygame.Rect]):
+        # While the pattern stands still only the UI bar and the objects, where they
+        # were and where they are now, differ from the previous frame
+        pattern_offset = self._pattern_offset()
+        if self._prev_object_rects is None or pattern_offset != self._prev_pattern_offset:
+            pygame.display.flip()
+        else:
+            pygame.display.update(self._prev_object_rects + object_rects + [self._ui_bar])
+        self._prev_object_rects = object_rects
+        self._prev_pattern_offset = pattern_offset
     
     def draw_menu(self):
         self.screen.fill(COLORS['background'])
         
         # Title
-        title = self.font_large.render("Focus Catcher", True, COLORS['white'])
+        title = self._render_text(self.font_large, "Focus Catcher", COLORS['white'])
         title_rect = title.get_rect(center=(SCREEN_WIDTH // 2, 200))
         self.screen.blit(title, title_rect)
         
         # Subtitle
-        subtitle = self.font_medium.render("Visual Attention Game", True, COLORS['white'])
+        subtitle = self._render_text(self.font_medium, "Visual Attention Game", COLORS['white'])
         subtitle_rect = subtitle.get_rect(center=(SCREEN_WIDTH // 2, 250))
         self.screen.blit(subtitle, subtitle_rect)
         
         # Description
-        desc = self.font_small.render("Improve focus and impulse control", True, COLORS['white'])
+        desc = self._render_text(self.font_small, "Improve focus and impulse control", COLORS['white'])
         desc_rect = desc.get_rect(center=(SCREEN_WIDTH // 2, 300))
         self.screen.blit(desc, desc_rect)
         
         # Buttons
-        button_width, button_height = 200, 50
-        start_button = pygame.Rect(SCREEN_WIDTH // 2 - button_width // 2, 400, button_width, button_height)
-        progress_button = pygame.Rect(SCREEN_WIDTH // 2 - button_width // 2, 480, button_width, button_height)
+        start_button = self._start_button
+        progress_button = self._progress_button
         
         pygame.draw.rect(self.screen, COLORS['white'], start_button)
         pygame.draw.rect(self.screen, COLORS['white'], progress_button)
         
-        start_text = self.font_medium.render("Start Game", True, COLORS['black'])
+        start_text = self._render_text(self.font_medium, "Start Game", COLORS['black'])
         start_text_rect = start_text.get_rect(center=start_button.center)
         self.screen.blit(start_text, start_text_rect)
         
-        progress_text = self.font_medium.render("View Progress", True, COLORS['black'])
+        progress_text = self._render_text(self.font_medium, "View Progress", COLORS['black'])
         progress_text_rect = progress_text.get_rect(center=progress_button.center)
         self.screen.blit(progress_text, progress_text_rect)
-        
-        return start_button, progress_button
     
     def draw_level_select(self):
         self.screen.fill(COLORS['background'])
         
         # Title
-        title = self.font_large.render("Select Level", True, COLORS['white'])
+        title = self._render_text(self.font_large, "Select Level", COLORS['white'])
         title_rect = title.get_rect(center=(SCREEN_WIDTH // 2, 50))
         self.screen.blit(title, title_rect)
         
         # Level buttons
-        buttons = []
-        cols = 5
-        rows = 2
-        button_width, button_height = 200, 120
-        start_x = (SCREEN_WIDTH - cols * button_width - (cols - 1) * 20) // 2
-        start_y = 150
-        
-        for i, config in enumerate(self.level_configs):
-            row = i // cols
-            col = i % cols
-            x = start_x + col * (button_width + 20)
-            y = start_y + row * (button_height + 30)
-            
-            # Check if level is unlocked
+        for button_rect, config in self._level_buttons:
+            x, y = button_rect.topleft
             stats = self.get_level_stats(config.level)
-            is_unlocked = config.level == 1 or (stats and stats.best_accuracy >= 70)
+            is_unlocked = self.is_level_unlocked(config.level)
             
-            button_rect = pygame.Rect(x, y, button_width, button_height)
             color = COLORS['white'] if is_unlocked else COLORS['gray']
             pygame.draw.rect(self.screen, color, button_rect)
             pygame.draw.rect(self.screen, COLORS['black'], button_rect, 2)
             
             # Level info
-            level_text = self.font_medium.render(f"Level {config.level}", True, COLORS['black'])
-            name_text = self.font_small.render(config.name, True, COLORS['black'])
-            desc_text = self.font_small.render(config.description[:25] + "...", True, COLORS['black'])
+            level_text = self._render_text(self.font_medium, f"Level {config.level}", COLORS['black'])
+            name_text = self._render_text(self.font_small, config.name, COLORS['black'])
+            desc_text = self._render_text(self.font_small, config.description[:25] + "...", COLORS['black'])
             
             self.screen.blit(level_text, (x + 10, y + 10))
             self.screen.blit(name_text, (x + 10, y + 40))
             self.screen.blit(desc_text, (x + 10, y + 65))
             
             if stats:
-                accuracy_text = self.font_small.render(f"Best: {int(stats.best_accuracy)}%", True, COLORS['black'])
+                accuracy_text = self._render_text(self.font_small, f"Best: {int(stats.best_accuracy)}%", COLORS['black'])
                 self.screen.blit(accuracy_text, (x + 10, y + 90))
-            
-            if is_unlocked:
-                buttons.append((button_rect, config.level))
         
         # Back button
-        back_button = pygame.Rect(50, 50, 100, 40)
+        back_button = self._level_select_back_button
         pygame.draw.rect(self.screen, COLORS['white'], back_button)
-        back_text = self.font_small.render("Back", True, COLORS['black'])
+        back_text = self._render_text(self.font_small, "Back", COLORS['black'])
         back_text_rect = back_text.get_rect(center=back_button.center)
         self.screen.blit(back_text, back_text_rect)
-        
-        return buttons, back_button
     
     def draw_game_ui(self):
+        if self._refresh_hud():
+            self.screen.blit(self._hud_surface, self._ui_bar)
+    
+    def _refresh_hud(self) -> bool:
+        # The HUD only changes on clicks, so it is composed into its own surface when
+        # one of its values changes and shown as a whole every frame
         if not self.current_session:
-            return
+            return False
         
-        level_config = self.get_level_config(self.current_level)
+        level_config = self.current_level_config
         if not level_config:
-            return
+            return False
+        
+        session = self.current_session
+        hud_key = (self.current_level, self.game_score, session.correct_clicks, session.incorrect_clicks, self.lives)
+        if hud_key != self._hud_key:
+            self._hud_key = hud_key
+            self._draw_hud(level_config)
+        return True
+    
+    def _draw_hud(self, level_config: LevelConfig):
+        surface = self._hud_surface
         
         # Top UI bar
-        ui_height = 80
-        pygame.draw.rect(self.screen, (*COLORS['white'], 200), (0, 0, SCREEN_WIDTH, ui_height))
+        pygame.draw.rect(surface, (*COLORS['white'], 200), surface.get_rect())
         
         # Level info
-        level_text = self.font_medium.render(f"Level {self.current_level}: {level_config.name}", True, COLORS['black'])
-        self.screen.blit(level_text, (20, 10))
+        level_text = self._render_text(self.font_medium, f"Level {self.current_level}: {level_config.name}", COLORS['black'])
+        surface.blit(level_text, (20, 10))
         
         # Score
-        score_text = self.font_small.render(f"Score: {self.game_score}", True, COLORS['black'])
-        self.screen.blit(score_text, (20, 40))
+        score_text = self._render_text(self.font_small, f"Score: {self.game_score}", COLORS['black'])
+        surface.blit(score_text, (20, 40))
         
         # Progress
-        progress = (self.current_session.correct_clicks / level_config.required_correct_clicks) * 100
-        progress_text = self.font_small.render(f"Progress: {self.current_session.correct_clicks}/{level_config.required_correct_clicks}", True, COLORS['black'])
-        self.screen.blit(progress_text, (200, 40))
+        progress_text = self._render_text(self.font_small, f"Progress: {self.current_session.correct_clicks}/{level_config.required_correct_clicks}", COLORS['black'])
+        surface.blit(progress_text, (200, 40))
         
         # Lives
         for i in range(3):
             color = COLORS['red'] if i < self.lives else COLORS['gray']
-            pygame.draw.circle(self.screen, color, (SCREEN_WIDTH - 150 + i * 30, 30), 10)
+            pygame.draw.circle(surface, color, (SCREEN_WIDTH - 150 + i * 30, 30), 10)
         
         # Accuracy
         total_clicks = self.current_session.correct_clicks + self.current_session.incorrect_clicks
         accuracy = (self.current_session.correct_clicks / total_clicks * 100) if total_clicks > 0 else 0
-        accuracy_text = self.font_small.render(f"Accuracy: {int(accuracy)}%", True, COLORS['black'])
-        self.screen.blit(accuracy_text, (400, 40))
+        accuracy_text = self._render_text(self.font_small, f"Accuracy: {int(accuracy)}%", COLORS['black'])
+        surface.blit(accuracy_text, (400, 40))
         
         # Target reminder
-        target_text = self.font_small.render(f"Target: {level_config.target_type.value.title()}s", True, COLORS['black'])
-        self.screen.blit(target_text, (600, 40))
-        
-        # Pause button
-        pause_button = pygame.Rect(SCREEN_WIDTH - 80, 10, 60, 30)
-        pygame.draw.rect(self.screen, COLORS['white'], pause_button)
-        pygame.draw.rect(self.screen, COLORS['black'], pause_button, 2)
-        pause_text = self.font_small.render("Pause", True, COLORS['black'])
+        target_text = self._render_text(self.font_small, f"Target: {level_config.target_type.value.title()}s", COLORS['black'])
+        surface.blit(target_text, (600, 40))
+        
+        # Pause button (the bar sits at the top-left corner, so screen and bar coordinates agree)
+        pause_button = self._pause_button
+        pygame.draw.rect(surface, COLORS['white'], pause_button)
+        pygame.draw.rect(surface, COLORS['black'], pause_button, 2)
+        pause_text = self._render_text(self.font_small, "Pause", COLORS['black'])
         pause_text_rect = pause_text.get_rect(center=pause_button.center)
-        self.screen.blit(pause_text, pause_text_rect)
-        
-        return pause_button
+        surface.blit(pause_text, pause_text_rect)
+    
+    def draw_playfield(self) -> List[pygame.Rect]:
+        # The PLAYING frame, also shown beneath the pause dialog; returns the object blit rects
+        self.draw_background()
+        object_rects = self.draw_objects()
+        self.draw_game_ui()
+        return object_rects
     
     def draw_paused(self):
         # Semi-transparent overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.set_alpha(128)
-        overlay.fill(COLORS['black'])
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self._pause_overlay, (0, 0))
         
         # Pause dialog
-        dialog_width, dialog_height = 400, 200
-        dialog_rect = pygame.Rect((SCREEN_WIDTH - dialog_width) // 2, (SCREEN_HEIGHT - dialog_height) // 2, dialog_width, dialog_height)
+        dialog_rect = self._pause_dialog
         pygame.draw.rect(self.screen, COLORS['white'], dialog_rect)
         pygame.draw.rect(self.screen, COLORS['black'], dialog_rect, 3)
         
         # Text
-        paused_text = self.font_large.render("Game Paused", True, COLORS['black'])
+        paused_text = self._render_text(self.font_large, "Game Paused", COLORS['black'])
         paused_rect = paused_text.get_rect(center=(dialog_rect.centerx, dialog_rect.centery - 40))
         self.screen.blit(paused_text, paused_rect)
         
         # Resume button
-        resume_button = pygame.Rect(dialog_rect.centerx - 80, dialog_rect.centery + 20, 160, 40)
+        resume_button = self._resume_button
         pygame.draw.rect(self.screen, COLORS['green'], resume_button)
-        resume_text = self.font_medium.render("Resume", True, COLORS['white'])
+        resume_text = self._render_text(self.font_medium, "Resume", COLORS['white'])
         resume_text_rect = resume_text.get_rect(center=resume_button.center)
         self.screen.blit(resume_text, resume_text_rect)
-        
-        return resume_button
     
     def draw_progress(self):
         self.screen.fill(COLORS['background'])
         
         # Title
-        title = self.font_large.render("Progress Report", True, COLORS['white'])
+        title = self._render_text(self.font_large, "Progress Report", COLORS['white'])
         title_rect = title.get_rect(center=(SCREEN_WIDTH // 2, 50))
         self.screen.blit(title, title_rect)
         
         # Overall stats
-        total_sessions = len(self.sessions)
-        avg_accuracy = sum(s.accuracy for s in self.sessions) / len(self.sessions) if self.sessions else 0
-        levels_completed = len([p for p in self.level_progress if p.best_accuracy >= 70])
+        total_sessions = self._sessions_total
+        avg_accuracy = self._sessions_accuracy_sum / total_sessions if total_sessions else 0
+        levels_completed = len([p for p in self.level_progress.values() if p.best_accuracy >= 70])
         
         stats_y = 120
         stats = [
@@ -659,115 +1045,181 @@ class FocusCatcherGame:
         ]
         
         for i, stat in enumerate(stats):
-            stat_text = self.font_medium.render(stat, True, COLORS['white'])
+            stat_text = self._render_text(self.font_medium, stat, COLORS['white'])
             self.screen.blit(stat_text, (50, stats_y + i * 30))
         
         # Level progress
         progress_y = 250
-        progress_title = self.font_medium.render("Level Progress:", True, COLORS['white'])
+        progress_title = self._render_text(self.font_medium, "Level Progress:", COLORS['white'])
         self.screen.blit(progress_title, (50, progress_y))
         
-        for i, progress in enumerate(self.level_progress[:10]):  # Show first 10 levels
+        for i, progress in enumerate(list(self.level_progress.values())[:10]):  # Show first 10 levels
             y = progress_y + 40 + i * 30
             level_text = f"Level {progress.level}: {int(progress.best_accuracy)}% accuracy, {int(progress.best_reaction_time)}ms reaction"
-            text = self.font_small.render(level_text, True, COLORS['white'])
+            text = self._render_text(self.font_small, level_text, COLORS['white'])
             self.screen.blit(text, (70, y))
         
         # Back button
-        back_button = pygame.Rect(50, SCREEN_HEIGHT - 80, 100, 40)
+        back_button = self._progress_back_button
         pygame.draw.rect(self.screen, COLORS['white'], back_button)
-        back_text = self.font_small.render("Back", True, COLORS['black'])
+        back_text = self._render_text(self.font_small, "Back", COLORS['black'])
         back_text_rect = back_text.get_rect(center=back_button.center)
         self.screen.blit(back_text, back_text_rect)
-        
-        return back_button
+    
+    def update_playing(self, delta_time: float):
+        self.background_offset += self._background_speed * delta_time
+        self.game_time += delta_time
+        current_time = self.game_time * 1000
+        self.spawn_object(delta_time * 1000, current_time)
+        self.update_objects(delta_time, current_time)
+    
+    def _on_quit(self, event: pygame.event.Event):
+        self.running = False
+    
+    def _on_mouse_down(self, event: pygame.event.Event):
+        if event.button == 1:  # Left click
+            self._click_dispatch[self.game_state](pygame.mouse.get_pos())
+    
+    def _on_keydown(self, event: pygame.event.Event):
+        if event.key == pygame.K_ESCAPE:
+            if self.game_state == GameState.PLAYING:
+                self.game_state = GameState.PAUSED
+            elif self.game_state == GameState.PAUSED:
+                self.game_state = GameState.PLAYING
+            else:
+                self.game_state = GameState.MENU
+    
+    def _on_expose(self, event: pygame.event.Event):
+        # The window contents were lost, so the next frame redraws even a static screen
+        # and a PLAYING frame is presented in full rather than as dirty rects
+        self._presented_state = None
+        self._prev_object_rects = None
+    
+    def _click_menu(self, pos: Tuple[int, int]):
+        if self._start_button.collidepoint(pos):
+            self.game_state = GameState.LEVEL_SELECT
+        elif self._progress_button.collidepoint(pos):
+            self.game_state = GameState.PROGRESS
+    
+    def _click_level_select(self, pos: Tuple[int, int]):
+        if self._level_select_back_button.collidepoint(pos):
+            self.game_state = GameState.MENU
+        else:
+            x, y = pos
+            bounds = self._level_button_bounds
+            hits = np.flatnonzero((bounds[:, 0] <= x) & (x < bounds[:, 2]) & (bounds[:, 1] <= y) & (y < bounds[:, 3]))
+            if hits.size:
+                config = self._level_buttons[hits[0]][1]
+                if self.is_level_unlocked(config.level):
+                    self.start_game(config.level)
+    
+    def _click_playing(self, pos: Tuple[int, int]):
+        if self._pause_button.collidepoint(pos):
+            self.game_state = GameState.PAUSED
+        else:
+            self.handle_click(pos)
+    
+    def _click_paused(self, pos: Tuple[int, int]):
+        if self._resume_button.collidepoint(pos):
+            self.game_state = GameState.PLAYING
+    
+    def _click_progress(self, pos: Tuple[int, int]):
+        if self._progress_back_button.collidepoint(pos):
+            self.game_state = GameState.MENU
+    
+    def _draw_playing(self) -> Optional[List[pygame.Rect]]:
+        self._paused_snapshot = None
+        if self.renderer:
+            self._render_playing()
+            return None
+        return self.draw_playfield()
+    
+    def _draw_paused(self):
+        # Nothing moves while paused, so the playfield is drawn once per pause and reused
+        if self._paused_snapshot is None:
+            self.draw_playfield()
+            self._paused_snapshot = self.screen.copy()
+        else:
+            self.screen.blit(self._paused_snapshot, (0, 0))
+        self.draw_paused()
+    
+    def _build_dispatch(self):
+        # Event handlers by event type, plus per-state click and draw handlers,
+        # looked up once per event / frame
+        self._event_handlers = {
+            pygame.QUIT: self._on_quit,
+            pygame.MOUSEBUTTONDOWN: self._on_mouse_down,
+            pygame.KEYDOWN: self._on_keydown,
+            pygame.VIDEOEXPOSE: self._on_expose,
+            pygame.WINDOWEXPOSED: self._on_expose,
+        }
+        self._click_dispatch = {
+            GameState.MENU: self._click_menu,
+            GameState.LEVEL_SELECT: self._click_level_select,
+            GameState.PLAYING: self._click_playing,
+            GameState.PAUSED: self._click_paused,
+            GameState.PROGRESS: self._click_progress,
+        }
+        self._draw_dispatch = {
+            GameState.MENU: partial(self._draw_cached_screen, self.draw_menu),
+            GameState.LEVEL_SELECT: partial(self._draw_cached_screen, self.draw_level_select),
+            GameState.PLAYING: self._draw_playing,
+            GameState.PAUSED: self._draw_paused,
+            GameState.PROGRESS: partial(self._draw_cached_screen, self.draw_progress),
+        }
     
     def run(self):
+        # Objects live in preallocated arrays, so the loop only makes short-lived garbage;
+        # move everything built at startup out of the collector's view
+        gc.collect()
+        gc.freeze()
+        
+        # Names used every iteration, bound to locals once
+        tick = self.clock.tick
+        get_events = pygame.event.get
+        flip = pygame.display.flip
+        event_handlers = self._event_handlers
+        draw_dispatch = self._draw_dispatch
+        PLAYING = GameState.PLAYING
+        
         while self.running:
-            delta_time = self.clock.tick(FPS) / 1000.0
+            frame_time = min(tick(FPS) / 1000.0, MAX_FRAME_TIME)
             
             # Handle events
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    self.running = False
-                
-                elif event.type == pygame.MOUSEBUTTONDOWN:
-                    if event.button == 1:  # Left click
-                        pos = pygame.mouse.get_pos()
-                        
-                        if self.game_state == GameState.MENU:
-                            start_button, progress_button = self.draw_menu()
-                            if start_button.collidepoint(pos):
-                                self.game_state = GameState.LEVEL_SELECT
-                            elif progress_button.collidepoint(pos):
-                                self.game_state = GameState.PROGRESS
-                        
-                        elif self.game_state == GameState.LEVEL_SELECT:
-                            level_buttons, back_button = self.draw_level_select()
-                            if back_button.collidepoint(pos):
-                                self.game_state = GameState.MENU
-                            else:
-                                for button_rect, level in level_buttons:
-                                    if button_rect.collidepoint(pos):
-                                        self.start_game(level)
-                                        break
-                        
-                        elif self.game_state == GameState.PLAYING:
-                            pause_button = self.draw_game_ui()
-                            if pause_button and pause_button.collidepoint(pos):
-                                self.game_state = GameState.PAUSED
-                            else:
-                                self.handle_click(pos)
-                        
-                        elif self.game_state == GameState.PAUSED:
-                            resume_button = self.draw_paused()
-                            if resume_button.collidepoint(pos):
-                                self.game_state = GameState.PLAYING
-                        
-                        elif self.game_state == GameState.PROGRESS:
-                            back_button = self.draw_progress()
-                            if back_button.collidepoint(pos):
-                                self.game_state = GameState.MENU
-                
-                elif event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_ESCAPE:
-                        if self.game_state == GameState.PLAYING:
-                            self.game_state = GameState.PAUSED
-                        elif self.game_state == GameState.PAUSED:
-                            self.game_state = GameState.PLAYING
-                        else:
-                            self.game_state = GameState.MENU
+            for event in get_events():
+                handler = event_handlers.get(event.type)
+                if handler:
+                    handler(event)
+            
+            game_state = self.game_state
             
             # Update game logic
-            if self.game_state == GameState.PLAYING:
-                level_config = self.get_level_config(self.current_level)
-                if level_config:
-                    self.background_offset += level_config.background_speed * delta_time
-                    self.game_time += delta_time
-                    self.spawn_object()
-                    self.update_objects(delta_time)
+            if game_state == PLAYING and self.current_level_config:
+                # Slow frames are split so objects never jump past the culling bounds or
+                # skip spawns; normal frames take a single step
+                while frame_time > 0:
+                    delta_time = min(frame_time, MAX_SIMULATION_STEP)
+                    frame_time -= delta_time
+                    self.update_playing(delta_time)
+            
+            # Screens other than PLAYING are static, so they are drawn once when shown
+            if game_state != PLAYING and game_state == self._presented_state:
+                continue
             
             # Draw everything
-            if self.game_state == GameState.MENU:
-                self.draw_menu()
-            elif self.game_state == GameState.LEVEL_SELECT:
-                self.draw_level_select()
-            elif self.game_state == GameState.PLAYING:
-                self.draw_background()
-                for obj in self.game_objects:
-                    obj.draw(self.screen)
-                self.draw_game_ui()
-            elif self.game_state == GameState.PAUSED:
-                self.draw_background()
-                for obj in self.game_objects:
-                    obj.draw(self.screen)
-                self.draw_game_ui()
-                self.draw_paused()
-            elif self.game_state == GameState.PROGRESS:
-                self.draw_progress()
+            object_rects = draw_dispatch[game_state]()
             
-            pygame.display.flip()
+            if self.renderer:
+                if game_state != PLAYING:
+                    self._present_canvas()
+            elif game_state == PLAYING:
+                self._present_playing(object_rects)
+            else:
+                flip()
+                self._prev_object_rects = None
+            self._presented_state = game_state
         
+        self._io.shutdown(wait=True)
         pygame.quit()
 
 if __name__ == "__main__":